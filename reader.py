@@ -1,8 +1,17 @@
 import argparse
+import locale
+import os
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -12,18 +21,43 @@ FILE_TYPE = "2"            # SLCF
 SAMPLING_FACTOR = "1"      # all data
 DOMAIN_LIMIT = "n"         # no domain limit
 
+# On Windows every spawn would otherwise create (and flash) a console
+# window, which also slows CreateProcess down across thousands of runs.
+_WIN = sys.platform == "win32"
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if _WIN else 0
+
+# fds2ascii re-prints this prompt when it loops back for another job.
+# Seeing it again on stdout means the previous job has finished.
+REPROMPT_MARKER = "Enter Job ID string"
+
+# Time points handed to one fds2ascii process per dispatch.  Batching
+# amortizes process startup and .smv parsing across the whole chunk.
+BATCH_SIZE = 16
+
+# How many trailing fds2ascii output lines to keep for error reports.
+OUTPUT_TAIL_LINES = 120
+
+# The tmp-then-rename dance only exists to dodge Fortran long-path
+# issues.  When the output directory path is comfortably short, point
+# fds2ascii straight at the final location and skip the rename.
+DIRECT_WRITE_MAX_PATH = 120
+
 
 # ───────────────────────────────────────────────────────────────
 #  Input parsing helpers
 # ───────────────────────────────────────────────────────────────
 
+_RANGE_RE = re.compile(r"[\s,\-~]+")
+_SIMPLE_RANGE_RE = re.compile(r"^(\d+)-(\d+)$")
+
+
 def parse_int_range(s: str) -> tuple[int, int]:
     """
     Parse a simple integer range string.
     Accepts: "0-200", "0 200", "0,200", "0~200"
     Returns: (start, end) inclusive.
     """
-    tokens = [t for t in re.split(r"[\s,\-~]+", s.strip()) if t]
+    tokens = [t for t in _RANGE_RE.split(s.strip()) if t]
     if len(tokens) != 2:
         raise ValueError(f"Cannot parse range: {s!r}. Example: 0-200")
     start, end = int(float(tokens[0])), int(float(tokens[1]))
@@ -39,6 +73,15 @@ def parse_groups(s: str) -> list[int]:
     Returns: sorted list of 1-based group numbers.
     """
     s = s.strip()
+
+    # Fast path: a single "a-b" range needs no set or sort.
+    m = _SIMPLE_RANGE_RE.match(s)
+    if m:
+        a, b = int(m.group(1)), int(m.group(2))
+        if a < 1:
+            raise ValueError(f"Group number must >= 1, got {a}")
+        return list(range(a, b + 1))
+
     groups: set[int] = set()
     for part in s.split(","):
         part = part.strip()
@@ -66,11 +109,11 @@ def build_stdin(
     tmin: float,
     tmax: float,
     var_count: int,
-    var_indices: list[int],
+    var_block: str,
     output_filename: str,
 ) -> str:
     """
-    Build the complete stdin text for one fds2ascii invocation.
+    Build the complete stdin text for one fds2ascii job.
 
     Prompt order (confirmed from fds2ascii source code):
       1. CHID
@@ -79,93 +122,413 @@ def build_stdin(
       4. Domain limit    -> n
       5. Time range      -> "tmin tmax"
       6. Var count
-      7. Var indices     -> one per line
+      7. Var indices     -> *var_block*, one per line (pre-joined once
+         per group so the hot loop does a single format, no list build)
       8. Output filename
     """
-    lines: list[str] = [
-        chid,
-        FILE_TYPE,
-        SAMPLING_FACTOR,
-        DOMAIN_LIMIT,
-        f"{tmin:.1f} {tmax:.1f}",
-        str(var_count),
+    return (
+        f"{chid}\n{FILE_TYPE}\n{SAMPLING_FACTOR}\n{DOMAIN_LIMIT}\n"
+        f"{tmin:.1f} {tmax:.1f}\n{var_count}\n{var_block}\n"
+        f"{output_filename}\n"
+    )
+
+
+class JobSpec(NamedTuple):
+    """One fds2ascii extraction: time point plus its file locations.
+    Paths are plain strings — built by concatenation and consumed by
+    os-level calls, keeping Path machinery out of the per-job loop."""
+    t: int
+    tmin: float
+    tmax: float
+    tmp_name: str
+    tmp_path: str
+    final_path: str
+
+
+def build_stdin_multi(
+    chid: str,
+    var_count: int,
+    var_block: str,
+    jobs: list[JobSpec],
+) -> str:
+    """
+    Build one stdin script covering several jobs back-to-back.
+
+    fds2ascii loops back to the CHID prompt after each job, so the
+    script is simply the per-job prompt sequences concatenated.
+    """
+    return "".join(
+        build_stdin(
+            chid=chid,
+            tmin=job.tmin,
+            tmax=job.tmax,
+            var_count=var_count,
+            var_block=var_block,
+            output_filename=job.tmp_name,
+        )
+        for job in jobs
+    )
+
+
+class Fds2AsciiSession:
+    """
+    Runs fds2ascii scripts, one process per script, with stdin fed by
+    the kernel from a pre-written script file.
+
+    Each script covers a whole chunk of jobs (see build_stdin_multi),
+    so process startup and .smv parsing are amortized across the chunk.
+    The script is encoded once and handed to the process as its stdin
+    file descriptor — an in-memory memfd on Linux, an unnamed temp file
+    elsewhere — so the worker thread never sits in a pipe-write loop
+    and the tool reads its input at its own pace.  After finishing a
+    job the tool loops back to the CHID prompt; seeing REPROMPT_MARKER
+    on stdout again signals job completion.  A build that exits after
+    one job just ends the script early (correctness kept, amortization
+    lost — the caller replays leftovers).
+
+    One session per worker thread — the class is not thread-safe.
+    """
+
+    def __init__(self, fds2ascii_path: Path, results_dir: Path) -> None:
+        self.fds2ascii_path = fds2ascii_path
+        self.results_dir = results_dir
+        # Materialize the str forms once; a spawn happens per script
+        # and PurePath.__str__ is not free under thousands of jobs.
+        self._argv = [str(fds2ascii_path)]
+        self._cwd = str(results_dir)
+        self._proc: subprocess.Popen | None = None
+
+    @staticmethod
+    def _script_fd(script: str) -> int:
+        """Put the encoded script behind a file descriptor the child
+        can read directly, without touching the disk where possible.
+        Encoded with the locale's preferred encoding — the script can
+        carry non-ASCII CHIDs and output paths."""
+        data = script.encode(locale.getpreferredencoding(False))
+        if hasattr(os, "memfd_create"):
+            fd = os.memfd_create("fds2ascii_stdin")
+        else:
+            tmp = tempfile.TemporaryFile()
+            fd = os.dup(tmp.fileno())
+            tmp.close()
+        os.write(fd, data)
+        os.lseek(fd, 0, os.SEEK_SET)
+        return fd
+
+    def submit_script(
+        self,
+        script: str,
+        n_jobs: int,
+        on_job_done: Callable[[int], None] | None = None,
+    ) -> tuple[deque[str], int]:
+        """
+        Run a script of *n_jobs* back-to-back job blocks and wait until
+        fds2ascii has finished them (or exited).  Returns the tail of
+        the stdout lines produced meanwhile (fds2ascii prints per-mesh
+        progress, so only the last OUTPUT_TAIL_LINES are kept — enough
+        for error reporting without buffering megabytes per script)
+        and the tool's returncode.  Deciding whether a nonzero exit is
+        fatal is the caller's job — a looping build whose Fortran READ
+        error-stops at stdin EOF exits nonzero at the end of every
+        script even when every job completed.
+
+        *on_job_done* is called with the 0-based job index as soon as
+        that job's completion prompt is seen, so the caller can collect
+        its output while fds2ascii is already working on the next job.
+        """
+        fd = self._script_fd(script)
+        try:
+            proc = subprocess.Popen(
+                self._argv,
+                stdin=fd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                cwd=self._cwd,
+                creationflags=_CREATIONFLAGS,
+            )
+        finally:
+            os.close(fd)  # the child holds its own copy
+        self._proc = proc
+
+        lines: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        # The freshly started tool prints one CHID prompt to solicit
+        # input; that one does not mean "job done".
+        pending_prompts = 1
+        done = 0
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            lines.append(line.rstrip("\n"))
+            if REPROMPT_MARKER in line:
+                if pending_prompts:
+                    pending_prompts -= 1
+                    continue
+                if done < n_jobs:
+                    done += 1
+                    if on_job_done is not None:
+                        on_job_done(done - 1)
+
+        # EOF on stdout: the tool exhausted the script (or bailed).
+        returncode = proc.wait()
+        self._proc = None
+        return lines, returncode
+
+    def close(self) -> None:
+        """Reap a process left over from an interrupted script."""
+        proc = self._proc
+        self._proc = None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+
+class ProgressPrinter:
+    """
+    Collects progress lines from the worker threads and writes them to
+    stdout in batches.
+
+    A bare print() per job acquires the IO lock, encodes and flushes
+    every time, which serializes the workers on stdout. Lines are
+    buffered instead and written with one sys.stdout.write when the
+    buffer fills or *interval* seconds have passed since the last write.
+    """
+
+    def __init__(self, interval: float = 0.5, max_lines: int = 64) -> None:
+        self._interval = interval
+        self._max_lines = max_lines
+        self._lock = threading.Lock()
+        self._buf: list[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            self._buf.append(line)
+            now = time.monotonic()
+            if (len(self._buf) >= self._max_lines
+                    or now - self._last_flush >= self._interval):
+                self._drain(now)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._buf:
+                self._drain(time.monotonic())
+
+    def _drain(self, now: float) -> None:
+        sys.stdout.write("\n".join(self._buf) + "\n")
+        sys.stdout.flush()
+        self._buf.clear()
+        self._last_flush = now
+
+
+def _advise_sequential_posix(sf: Path) -> None:
+    """Prefetch the .sf file into the page cache.  The SEQUENTIAL hint
+    widens the read-ahead window for the WILLNEED prefetch issued on
+    the same fd; the hint itself dies with the fd, so only the pages
+    pulled in here outlive the call."""
+    fd = os.open(sf, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def _advise_sequential_windows(sf: Path) -> None:
+    """Open-and-close with FILE_FLAG_SEQUENTIAL_SCAN, nudging the
+    Windows cache manager to read ahead on the file; as on POSIX, only
+    cached data outlives the handle."""
+    import ctypes
+    from ctypes import wintypes
+
+    GENERIC_READ = 0x80000000
+    FILE_SHARE_READ_WRITE = 0x00000003
+    OPEN_EXISTING = 3
+    FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+        wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
     ]
-    lines.extend(str(i) for i in var_indices)
-    lines.append(output_filename)
-    return "\n".join(lines) + "\n"
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    handle = kernel32.CreateFileW(
+        str(sf), GENERIC_READ, FILE_SHARE_READ_WRITE, None,
+        OPEN_EXISTING, FILE_FLAG_SEQUENTIAL_SCAN, None,
+    )
+    if handle is not None and handle != INVALID_HANDLE_VALUE:
+        kernel32.CloseHandle(handle)
+
+
+def warm_case_files(results_dir: Path, chid: str) -> None:
+    """
+    Prime the OS cache for the case files before the workers start.
 
+    fds2ascii re-reads the .smv header and streams the slice .sf files
+    sequentially on every invocation; reading the small .smv once and
+    prefetching the .sf files with a widened read-ahead window means
+    the early invocations find the data hot instead of each paying a
+    cold read. Best effort — any OSError is ignored.
+    """
+    smv = results_dir / f"{chid}.smv"
+    try:
+        if smv.is_file():
+            smv.read_bytes()
+    except OSError:
+        pass
+
+    if hasattr(os, "posix_fadvise"):
+        advise = _advise_sequential_posix
+    elif sys.platform == "win32":
+        advise = _advise_sequential_windows
+    else:
+        return
+    for sf in results_dir.glob(f"{chid}*.sf"):
+        try:
+            advise(sf)
+        except OSError:
+            pass
 
-def run_fds2ascii(
-    fds2ascii_path: Path,
-    results_dir: Path,
+
+def run_fds2ascii_batch(
+    session: Fds2AsciiSession,
     out_dir: Path,
     chid: str,
-    t: int,
+    group: int,
+    time_points: list[int],
     start_t: int,
     end_t: int,
     var_count: int,
-    var_indices: list[int],
+    var_block: str,
+    same_device: bool = True,
+    direct_write: bool = False,
+    progress: ProgressPrinter | None = None,
 ) -> None:
     """
-    Run fds2ascii once for time point *t*.
+    Run fds2ascii for a chunk of time points on the given session.
 
-    Averaging window: [t-1, t+1], clamped to [start_t, end_t].
-    Output: out_dir/{t}.csv
-    """
-    # ── averaging window ──
-    tmin = max(start_t, t - 1)
-    tmax = min(end_t, t + 1)
-
-    # ── skip if already exists ──
-    final_path = out_dir / f"{t}.csv"
-    if final_path.exists():
-        print(f"[SKIP] {final_path.name} already exists")
-        return
+    Averaging window per point: [t-1, t+1], clamped to [start_t, end_t].
+    Output: out_dir/{t}.csv for each t.
 
-    # ── temp file in results_dir (avoids Fortran long-path issues) ──
-    tmp_name = f"__tmp_{chid}_t{t}.csv"
-    tmp_path = results_dir / tmp_name
-    if tmp_path.exists():
-        tmp_path.unlink()
-
-    stdin_text = build_stdin(
-        chid=chid,
-        tmin=float(tmin),
-        tmax=float(tmax),
-        var_count=var_count,
-        var_indices=var_indices,
-        output_filename=tmp_name,
-    )
+    *same_device* says whether results_dir and out_dir share a
+    filesystem; when True the tmp file is promoted with an atomic
+    os.replace instead of shutil.move's copy-capable fallback.
 
-    print(f"t={t}  avg=[{tmin}, {tmax}]  -> {final_path.name}")
+    *direct_write* points fds2ascii straight at the final path (via a
+    relative path from results_dir), skipping the tmp file and its
+    rename entirely.  Only safe for short paths on the same device.
+    """
+    # ── build job specs (already-exported points were filtered out
+    #    by the caller's scandir pass).  Plain string concatenation:
+    #    Path.__truediv__ and f-string formatting are measurably
+    #    heavier under thousands of jobs. ──
+    report = progress.write if progress is not None else print
+    out_dir_str = str(out_dir)
+    results_dir_str = str(session.results_dir)
+    jobs: list[JobSpec] = []
+    for t in time_points:
+        t_str = str(t)
+        final_name = t_str + ".csv"
+        final_path = out_dir_str + os.sep + final_name
+        if direct_write:
+            # tmp IS the final file: the tool writes it in place.
+            tmp_name = os.path.relpath(final_path, results_dir_str)
+            tmp_path = final_path
+        else:
+            # The group belongs in the name: different groups export
+            # the same time points concurrently, and all their tmp
+            # files share results_dir.
+            tmp_name = ("__tmp_" + chid + "_g" + str(group)
+                        + "_t" + t_str + ".csv")
+            tmp_path = results_dir_str + os.sep + tmp_name
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        tmin = max(start_t, t - 1)
+        tmax = min(end_t, t + 1)
+        report(f"t={t}  avg=[{tmin}, {tmax}]  -> {final_name}")
+        jobs.append(JobSpec(
+            t=t,
+            tmin=float(tmin),
+            tmax=float(tmax),
+            tmp_name=tmp_name,
+            tmp_path=tmp_path,
+            final_path=final_path,
+        ))
+
+    def _promote(job: JobSpec) -> None:
+        if job.tmp_path == job.final_path:
+            return  # direct write: nothing to rename
+        if same_device:
+            os.replace(job.tmp_path, job.final_path)
+        else:
+            shutil.move(job.tmp_path, job.final_path)
 
-    # ── execute ──
-    proc = subprocess.run(
-        [str(fds2ascii_path)],
-        input=stdin_text,
-        text=True,
-        cwd=str(results_dir),
-        capture_output=True,
-    )
+    # ── feed the chunk; replay leftovers if the tool exits early ──
+    pending = jobs
+    while pending:
+        script = build_stdin_multi(chid, var_count, var_block, pending)
 
-    if proc.returncode != 0:
-        print("\n=== fds2ascii STDOUT (tail) ===")
-        print("\n".join(proc.stdout.splitlines()[-80:]))
-        print("=== fds2ascii STDERR ===")
-        print(proc.stderr)
-        raise RuntimeError(
-            f"fds2ascii failed at t={t} (returncode={proc.returncode})"
-        )
+        # Promote each CSV the moment its completion prompt appears,
+        # overlapping the rename with fds2ascii's work on the next job.
+        promoted: set[int] = set()
 
-    if not tmp_path.exists():
-        print("\n=== fds2ascii STDOUT (tail) ===")
-        print("\n".join(proc.stdout.splitlines()[-120:]))
-        print("=== fds2ascii STDERR ===")
-        print(proc.stderr)
-        raise FileNotFoundError(f"Expected output not created: {tmp_path}")
+        def _collect(i: int, batch: list[JobSpec] = pending) -> None:
+            _promote(batch[i])
+            promoted.add(i)
 
-    # ── move to final location ──
-    shutil.move(str(tmp_path), str(final_path))
+        try:
+            out_lines, returncode = session.submit_script(
+                script, len(pending), on_job_done=_collect
+            )
+            if returncode != 0 and len(promoted) < len(pending):
+                # Flush buffered progress first so the error tail does
+                # not interleave with lines that logically preceded it.
+                if progress is not None:
+                    progress.flush()
+                print("\n=== fds2ascii output (tail) ===")
+                print("\n".join(out_lines))
+                raise RuntimeError(
+                    f"fds2ascii failed (returncode={returncode})"
+                )
+        except BaseException:
+            # Direct-write has no tmp-then-rename barrier: if the tool
+            # died mid-write (crash, KeyboardInterrupt -> kill) a
+            # truncated CSV may sit at the final path, and the resume
+            # filter would silently keep it. Drop any unpromoted
+            # direct-write target before propagating.
+            if direct_write:
+                for i, job in enumerate(pending):
+                    if i not in promoted and os.path.exists(job.final_path):
+                        try:
+                            os.unlink(job.final_path)
+                        except OSError:
+                            pass
+            raise
+
+        # Sweep anything that finished without a prompt (early exit).
+        leftovers = [
+            job for i, job in enumerate(pending) if i not in promoted
+        ]
+        finished = [
+            job for job in leftovers if os.path.exists(job.tmp_path)
+        ]
+        if not promoted and not finished:
+            if progress is not None:
+                progress.flush()
+            print("\n=== fds2ascii output (tail) ===")
+            print("\n".join(out_lines))
+            raise FileNotFoundError(
+                f"Expected output not created: {pending[0].tmp_path}"
+            )
+        for job in finished:
+            _promote(job)
+        pending = [job for job in leftovers if job not in finished]
 
 
 # ───────────────────────────────────────────────────────────────
@@ -192,13 +555,19 @@ def build_arg_parser() -> argparse.ArgumentParser:
                     help="How many variables to read (e.g. 9)")
     p.add_argument("--groups", type=str, default=None,
                     help="Groups to extract, e.g. '1' or '1-5' or '1,3,10'")
+    p.add_argument("--jobs", type=int, default=None,
+                    help="Parallel fds2ascii invocations (default: CPU count)")
     return p
 
 
 def _ask_if_missing(value: str | None, prompt: str) -> str:
-    """Return *value* if provided, otherwise fall back to interactive input."""
+    """Return *value* if provided, otherwise fall back to interactive
+    input.  Without a TTY (CI, outer batch drivers) there is nobody to
+    answer the prompt, so fail fast instead of blocking forever."""
     if value is not None:
         return value
+    if not sys.stdin.isatty():
+        raise SystemExit(f"Missing required argument: {prompt.strip().rstrip(':')}")
     return input(prompt).strip().strip('"')
 
 
@@ -207,7 +576,7 @@ def _ask_if_missing(value: str | None, prompt: str) -> str:
 # ───────────────────────────────────────────────────────────────
 
 def main() -> None:
-    print("=== fds2ascii Batch Exporter (serial) ===\n")
+    print("=== fds2ascii Batch Exporter ===\n")
 
     args = build_arg_parser().parse_args()
 
@@ -231,7 +600,7 @@ def main() -> None:
     )
 
     var_count = args.vars if args.vars is not None else \
-        int(input("How many variables to read: ").strip())
+        int(_ask_if_missing(None, "How many variables to read: "))
     if var_count < 1:
         raise ValueError(f"var_count must >= 1, got {var_count}")
 
@@ -239,54 +608,146 @@ def main() -> None:
         _ask_if_missing(args.groups, "Groups to extract (e.g. '1' or '1-5' or '1,3,10'): ")
     )
 
-    # ── validation ──
+    # ── validation (everything checked before anything spawns) ──
     if not fds2ascii.is_file():
         raise FileNotFoundError(f"fds2ascii not found: {fds2ascii}")
     if not results_dir.is_dir():
         raise FileNotFoundError(f"Results folder not found: {results_dir}")
+    if not groups:
+        raise ValueError("No groups to extract")
 
     time_points = list(range(start_t, end_t + 1))
-    total_runs = len(groups) * len(time_points)
+
+    # One-time check: when results and output share a filesystem, tmp
+    # files can be promoted with an atomic rename instead of copy+unlink.
+    out_root.mkdir(parents=True, exist_ok=True)
+    same_device = (
+        os.stat(results_dir).st_dev == os.stat(out_root).st_dev
+    )
+
+    # ── build the full work list: one item per chunk of time points.
+    #    One scandir per group dir replaces a stat per (group, t) pair,
+    #    so resumed runs only schedule the points still missing. ──
+    work: list[tuple[int, list[int], str, Path]] = []
+    skipped = 0
+    for group in groups:
+        idx_start = (group - 1) * var_count + 1
+        # Pre-join the var-index block once per group; the hot loop
+        # then only formats one template string per job.
+        var_block = "\n".join(
+            map(str, range(idx_start, idx_start + var_count))
+        )
+
+        group_dir = out_root / f"group_{group}"
+        group_dir.mkdir(parents=True, exist_ok=True)
+
+        existing = {
+            entry.name for entry in os.scandir(group_dir)
+            if entry.name.endswith(".csv")
+        }
+        todo = [t for t in time_points if f"{t}.csv" not in existing]
+        skipped += len(time_points) - len(todo)
+
+        for i in range(0, len(todo), BATCH_SIZE):
+            chunk = todo[i:i + BATCH_SIZE]
+            work.append((group, chunk, var_block, group_dir))
+
+    total_runs = sum(len(chunk) for _, chunk, _, _ in work)
 
     # ── summary ──
     print(f"\n{'─' * 50}")
     print(f"  Time points : {start_t} .. {end_t}  ({len(time_points)} points)")
     print(f"  Groups      : {groups}  ({len(groups)} groups)")
     print(f"  Vars / group: {var_count}")
-    print(f"  Total runs  : {total_runs}")
+    print(f"  Total runs  : {total_runs}  ({skipped} already exported)")
     for g in groups:
         idx_s = (g - 1) * var_count + 1
         idx_e = idx_s + var_count - 1
         print(f"    group {g} -> var indices {idx_s}..{idx_e}")
     print(f"{'─' * 50}\n")
 
-    # ── serial: group by group, time point by time point ──
-    counter = 0
-    for group in groups:
-        idx_start = (group - 1) * var_count + 1
-        var_indices = list(range(idx_start, idx_start + var_count))
-
-        group_dir = out_root / f"group_{group}"
-        group_dir.mkdir(parents=True, exist_ok=True)
+    if not work:
+        print("=== DONE — nothing to do, all files exist ===")
+        return
 
-        print(f"\n══ Group {group}  (var indices {var_indices[0]}..{var_indices[-1]}) ══")
-
-        for t in time_points:
-            counter += 1
-            print(f"  [{counter}/{total_runs}] ", end="")
-            run_fds2ascii(
-                fds2ascii_path=fds2ascii,
-                results_dir=results_dir,
-                out_dir=group_dir,
-                chid=chid,
-                t=t,
-                start_t=start_t,
-                end_t=end_t,
-                var_count=var_count,
-                var_indices=var_indices,
-            )
+    # ── prime the OS cache before the parallel storm begins ──
+    warm_case_files(results_dir, chid)
+
+    # ── parallel dispatch (threads suffice: the GIL is released
+    #    while we wait on the fds2ascii subprocess) ──
+    jobs = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
+    jobs = max(1, min(jobs, len(work)))
+    print(f"Running with {jobs} parallel job(s)\n")
+
+    progress = ProgressPrinter()
+
+    # ── one fds2ascii session per worker thread ──
+    tls = threading.local()
+    sessions: list[Fds2AsciiSession] = []
+    sessions_lock = threading.Lock()
+
+    def _session() -> Fds2AsciiSession:
+        s = getattr(tls, "session", None)
+        if s is None:
+            s = Fds2AsciiSession(fds2ascii, results_dir)
+            tls.session = s
+            with sessions_lock:
+                sessions.append(s)
+        return s
+
+    def _run(group: int, chunk: list[int], var_block: str,
+             group_dir: Path) -> None:
+        run_fds2ascii_batch(
+            session=_session(),
+            out_dir=group_dir,
+            chid=chid,
+            group=group,
+            time_points=chunk,
+            start_t=start_t,
+            end_t=end_t,
+            var_count=var_count,
+            var_block=var_block,
+            same_device=same_device,
+            direct_write=(
+                same_device
+                and len(str(group_dir)) < DIRECT_WRITE_MAX_PATH
+            ),
+            progress=progress,
+        )
 
-    print(f"\n=== DONE — {total_runs} files generated ===")
+    counter = 0
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(_run, group, chunk, var_block, group_dir):
+                    (group, chunk)
+                for group, chunk, var_block, group_dir in work
+            }
+            try:
+                for future in as_completed(futures):
+                    group, chunk = futures[future]
+                    future.result()  # re-raise worker exceptions
+                    counter += len(chunk)
+                    progress.write(
+                        f"  [{counter}/{total_runs}] group {group} "
+                        f"t={chunk[0]}..{chunk[-1]} done")
+            except BaseException:
+                # Worker failure or Ctrl-C (which lands inside
+                # as_completed, where the main thread blocks): drop the
+                # queued chunks and kill the in-flight tools so the
+                # with-block's final wait returns promptly instead of
+                # running the whole backlog first.
+                pool.shutdown(wait=False, cancel_futures=True)
+                with sessions_lock:
+                    for s in sessions:
+                        s.close()
+                raise
+    finally:
+        progress.flush()
+        for s in sessions:
+            s.close()
+
+    print(f"\n=== DONE — {total_runs} files generated ({skipped} skipped) ===")
 
 
 if __name__ == "__main__":